@@ -23,6 +23,7 @@ from .solve_qp import solve_problem, solve_qp
 from .solve_unconstrained import solve_unconstrained
 from .solvers import (
     cvxopt_solve_qp,
+    cvxopt_solve_qp_batch,
     daqp_solve_qp,
     dense_solvers,
     ecos_solve_qp,
@@ -58,6 +59,7 @@ __all__ = [
     "__version__",
     "available_solvers",
     "cvxopt_solve_qp",
+    "cvxopt_solve_qp_batch",
     "daqp_solve_qp",
     "dense_solvers",
     "ecos_solve_qp",
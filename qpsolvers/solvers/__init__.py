@@ -7,7 +7,7 @@
 """Import available QP solvers."""
 
 import warnings
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 from numpy import ndarray
 from scipy.sparse import csc_matrix
@@ -96,8 +96,22 @@ cvxopt_solve_qp: Optional[
     ]
 ] = None
 
+cvxopt_solve_qp_batch: Optional[
+    Callable[
+        [
+            Iterable[Dict[str, Any]],
+            Optional[int],
+        ],
+        List[Optional[ndarray]],
+    ]
+] = None
+
 try:
-    from .cvxopt_ import cvxopt_solve_problem, cvxopt_solve_qp
+    from .cvxopt_ import (
+        cvxopt_solve_problem,
+        cvxopt_solve_qp,
+        cvxopt_solve_qp_batch,
+    )
 
     solve_function["cvxopt"] = cvxopt_solve_problem
     available_solvers.append("cvxopt")
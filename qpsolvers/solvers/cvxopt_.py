@@ -15,7 +15,18 @@ using CVXOPT in some academic work, consider citing the corresponding report
 """
 
 import warnings
-from typing import Dict, Optional, Union
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import cvxopt
 import numpy as np
@@ -27,9 +38,228 @@ from ..exceptions import ProblemError, SolverError
 from ..problem import Problem
 from ..solution import Solution
 
+# CVXOPT is imported eagerly: qpsolvers.solvers detects available solvers
+# by catching ImportError when importing this module
 cvxopt.solvers.options["show_progress"] = False  # disable default verbosity
 
 
+def __major_indices(indptr: np.ndarray) -> np.ndarray:
+    """Get the major index of each nonzero of a compressed sparse matrix.
+
+    Parameters
+    ----------
+    indptr :
+        Column pointers of a CSC matrix, or row pointers of a CSR one.
+
+    Returns
+    -------
+    :
+        Column (CSC) or row (CSR) indices, in the same order as the minor
+        indices of the matrix.
+    """
+    return np.repeat(
+        np.arange(indptr.size - 1, dtype=np.int64), np.diff(indptr)
+    )
+
+
+def __as_float64(M: np.ndarray) -> np.ndarray:
+    """Get a contiguous double-precision version of a dense array.
+
+    Parameters
+    ----------
+    M :
+        Matrix or vector in NumPy format.
+
+    Returns
+    -------
+    :
+        Input array itself if it is already contiguous with dtype float64,
+        otherwise a contiguous float64 copy of it.
+
+    Notes
+    -----
+    Both C and Fortran orders are accepted. The latter is actually cheaper
+    to convert as CVXOPT stores matrices in column-major order.
+    """
+    if M.dtype == np.float64 and (
+        M.flags.c_contiguous or M.flags.f_contiguous
+    ):
+        return M
+    return np.array(M, dtype=np.float64, order="K")
+
+
+def __dense_to_cvxopt(M: np.ndarray) -> cvxopt.matrix:
+    """Convert dense matrix or vector to CVXOPT format.
+
+    Parameters
+    ----------
+    M :
+        Matrix or vector in NumPy format.
+
+    Returns
+    -------
+    :
+        Matrix in CVXOPT format, with infinite values clipped.
+    """
+    M = __as_float64(M)
+    if not np.isfinite(M).all():
+        __infty__ = 1e10  # 1e20 tends to yield division-by-zero errors
+        M = np.nan_to_num(M, posinf=__infty__, neginf=-__infty__)
+    return cvxopt.matrix(M)
+
+
+def __triplets_to_cvxopt(
+    data: np.ndarray, rows: np.ndarray, cols: np.ndarray, shape: tuple
+) -> cvxopt.spmatrix:
+    """Build a CVXOPT sparse matrix from triplet arrays.
+
+    Parameters
+    ----------
+    data :
+        Values of nonzero entries.
+    rows :
+        Row index of each nonzero.
+    cols :
+        Column index of each nonzero.
+    shape :
+        Matrix shape.
+
+    Returns
+    -------
+    :
+        Sparse matrix in CVXOPT format.
+
+    Notes
+    -----
+    The CVXOPT constructor reads NumPy arrays through the buffer protocol,
+    so we pass them directly rather than wrap each one in a dense CVXOPT
+    matrix first.
+
+    CVXOPT sorts row indices within each column on construction, whatever
+    the input order. Triplets from CSC and CSR matrices with sorted indices
+    are already in this order, which makes the sort cheaper. We don't call
+    ``sort_indices`` on unsorted inputs, as it modifies them in place and
+    costs about as much as it saves.
+    """
+    return cvxopt.spmatrix(
+        data.astype(np.double, copy=False),
+        rows.astype(np.int64, copy=False),
+        cols.astype(np.int64, copy=False),
+        size=shape,
+    )
+
+
+def __csc_triplets(
+    M: spa.csc_matrix,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get triplets of a CSC matrix.
+
+    Parameters
+    ----------
+    M :
+        Sparse matrix in CSC format.
+
+    Returns
+    -------
+    :
+        Data, row and column arrays.
+    """
+    return M.data, M.indices, __major_indices(M.indptr)
+
+
+def __csr_triplets(
+    M: spa.csr_matrix,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get triplets of a CSR matrix.
+
+    Parameters
+    ----------
+    M :
+        Sparse matrix in CSR format.
+
+    Returns
+    -------
+    :
+        Data, row and column arrays.
+    """
+    return M.data, __major_indices(M.indptr), M.indices
+
+
+def __coo_triplets(
+    M: spa.coo_matrix,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get triplets of a COO matrix.
+
+    Parameters
+    ----------
+    M :
+        Sparse matrix in COO format.
+
+    Returns
+    -------
+    :
+        Data, row and column arrays.
+    """
+    return M.data, M.row, M.col
+
+
+__TRIPLETS = {
+    "csc": __csc_triplets,
+    "csr": __csr_triplets,
+    "coo": __coo_triplets,
+}
+
+
+def __sparse_triplets(
+    M: spa.spmatrix,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get triplets of a sparse matrix in any SciPy format.
+
+    Parameters
+    ----------
+    M :
+        Sparse matrix.
+
+    Returns
+    -------
+    :
+        Data, row and column arrays.
+
+    Notes
+    -----
+    CSC, CSR and COO matrices are read without intermediate format. Other
+    formats, such as LIL or DOK, are converted to CSR first.
+    """
+    get_triplets = __TRIPLETS.get(M.format)
+    if get_triplets is not None:
+        return get_triplets(M)
+    return __csr_triplets(M.tocsr())
+
+
+def __sparse_to_cvxopt(M: spa.spmatrix) -> cvxopt.spmatrix:
+    """Convert sparse matrix in any SciPy format to CVXOPT format.
+
+    Parameters
+    ----------
+    M :
+        Sparse matrix.
+
+    Returns
+    -------
+    :
+        Sparse matrix in CVXOPT format.
+    """
+    return __triplets_to_cvxopt(*__sparse_triplets(M), M.shape)
+
+
+__CONVERTERS = {
+    np.ndarray: __dense_to_cvxopt,
+    spa.csc_matrix: __sparse_to_cvxopt,
+    spa.csr_matrix: __sparse_to_cvxopt,
+    spa.coo_matrix: __sparse_to_cvxopt,
+}
+
+
 def __to_cvxopt(
     M: Union[np.ndarray, spa.csc_matrix],
 ) -> Union[cvxopt.matrix, cvxopt.spmatrix]:
@@ -38,28 +268,182 @@ def __to_cvxopt(
     Parameters
     ----------
     M :
-        Matrix in NumPy or CVXOPT format.
+        Matrix in NumPy or SciPy sparse format.
 
     Returns
     -------
     :
         Matrix in CVXOPT format.
     """
+    converter = __CONVERTERS.get(type(M))
+    if converter is not None:
+        return converter(M)
+    if spa.issparse(M):
+        return __sparse_to_cvxopt(M)
+    return __dense_to_cvxopt(M)
+
+
+def __cost_to_cvxopt(
+    P: Union[np.ndarray, spa.csc_matrix],
+) -> Union[cvxopt.matrix, cvxopt.spmatrix]:
+    """Convert cost matrix to CVXOPT format.
+
+    Parameters
+    ----------
+    P :
+        Cost matrix in NumPy or SciPy sparse format.
+
+    Returns
+    -------
+    :
+        Cost matrix in CVXOPT format.
+
+    Notes
+    -----
+    CVXOPT only reads the lower triangular part of the cost matrix, so only
+    lower entries of sparse cost matrices are converted.
+
+    Dense diagonal cost matrices, such as those of least-squares problems,
+    are converted to sparse CVXOPT matrices with :math:`n` rather than
+    :math:`n^2` entries. Below a hundred variables this is not worth the
+    extra check.
+    """
+    if spa.issparse(P):
+        data, rows, cols = __sparse_triplets(P)
+        lower = rows >= cols
+        return __triplets_to_cvxopt(
+            data[lower], rows[lower], cols[lower], P.shape
+        )
+    if (
+        isinstance(P, np.ndarray)
+        and P.ndim == 2
+        and P.shape[0] == P.shape[1]
+        and P.shape[0] > 100
+    ):
+        diagonal = np.diagonal(P)
+        if np.count_nonzero(P) == np.count_nonzero(diagonal):
+            return cvxopt.spdiag(__dense_to_cvxopt(diagonal))
+    return __to_cvxopt(P)
+
+
+def __fingerprint(M: Union[np.ndarray, spa.csc_matrix]) -> tuple:
+    """Compute a cheap identity fingerprint of a matrix.
+
+    Parameters
+    ----------
+    M :
+        Matrix in NumPy or SciPy sparse format.
+
+    Returns
+    -------
+    :
+        Tuple identifying the matrix object and its underlying buffers.
+    """
     if isinstance(M, np.ndarray):
-        __infty__ = 1e10  # 1e20 tends to yield division-by-zero errors
-        M_noinf = np.nan_to_num(M, posinf=__infty__, neginf=-__infty__)
-        return cvxopt.matrix(M_noinf)
-    coo = M.tocoo()
-    return cvxopt.spmatrix(
-        coo.data.tolist(), coo.row.tolist(), coo.col.tolist(), size=M.shape
+        return (id(M), M.shape, M.ctypes.data)
+    return (
+        id(M),
+        M.shape,
+        M.nnz,
+        M.data.ctypes.data,
+        getattr(M, "indices", M.data).ctypes.data,
     )
 
 
+def __to_cvxopt_cached(
+    M: Union[np.ndarray, spa.csc_matrix],
+    cache: Optional[Dict[tuple, Any]],
+    converter: Callable[
+        [Union[np.ndarray, spa.csc_matrix]],
+        Union[cvxopt.matrix, cvxopt.spmatrix],
+    ] = __to_cvxopt,
+) -> Union[cvxopt.matrix, cvxopt.spmatrix]:
+    """Convert matrix to CVXOPT format, reusing a previous conversion.
+
+    Parameters
+    ----------
+    M :
+        Matrix in NumPy or SciPy sparse format.
+    cache :
+        Dictionary where conversions are stored, or ``None`` to disable
+        caching. Entries are removed when their source matrix is deleted.
+    converter :
+        Conversion function called on cache misses.
+
+    Returns
+    -------
+    :
+        Matrix in CVXOPT format.
+
+    Notes
+    -----
+    Matrices are identified by object and buffer addresses, not by value:
+    a matrix modified in place will not be converted again.
+    """
+    if cache is None:
+        return converter(M)
+    # Cost and constraint matrices are converted differently
+    key = (converter.__name__,) + __fingerprint(M)
+    entry = cache.get(key)
+    if entry is not None and entry[0]() is M:
+        return entry[1]
+    M_cvxopt = converter(M)
+    ref = weakref.ref(M, lambda _: cache.pop(key, None))
+    cache[key] = (ref, M_cvxopt)
+    return M_cvxopt
+
+
+def __stack_box_inequalities(
+    G: Optional[Union[cvxopt.matrix, cvxopt.spmatrix]],
+    h: Optional[np.ndarray],
+    lb: Optional[np.ndarray],
+    ub: Optional[np.ndarray],
+) -> Tuple[cvxopt.spmatrix, np.ndarray]:
+    """Append box inequalities to linear inequalities already in CVXOPT.
+
+    This is a variant of :func:`linear_from_box_inequalities` that builds the
+    box rows directly as CVXOPT sparse identities, rather than stacking them
+    in SciPy before converting the whole inequality matrix.
+
+    Parameters
+    ----------
+    G :
+        Linear inequality matrix in CVXOPT format, or ``None``.
+    h :
+        Linear inequality vector. ``G`` and ``h`` are ignored unless both are
+        set.
+    lb :
+        Lower bound constraint vector.
+    ub :
+        Upper bound constraint vector.
+
+    Returns
+    -------
+    G : cvxopt.spmatrix
+        Sparse matrix stacking :math:`G`, :math:`-I` if there is a lower
+        bound and :math:`+I` if there is an upper bound, in this order.
+    h : numpy.ndarray
+        Corresponding linear inequality vector.
+    """
+    G_blocks: List[Union[cvxopt.matrix, cvxopt.spmatrix]] = []
+    h_blocks: List[np.ndarray] = []
+    if G is not None and h is not None:
+        G_blocks.append(G)
+        h_blocks.append(h)
+    for bound, sign in ((lb, -1.0), (ub, +1.0)):
+        if bound is not None:
+            n = len(bound)  # == number of optimization variables
+            G_blocks.append(cvxopt.spdiag(cvxopt.matrix(sign, (n, 1))))
+            h_blocks.append(sign * bound)
+    return cvxopt.sparse(G_blocks), np.concatenate(h_blocks)
+
+
 def cvxopt_solve_problem(
     problem: Problem,
     solver: Optional[str] = None,
     initvals: Optional[np.ndarray] = None,
     verbose: bool = False,
+    cache: Optional[Dict[tuple, Any]] = None,
     **kwargs,
 ) -> Solution:
     r"""Solve a quadratic program using CVXOPT.
@@ -74,6 +458,11 @@ def cvxopt_solve_problem(
         Warm-start guess vector.
     verbose :
         Set to `True` to print out extra information.
+    cache :
+        Optional dictionary used to reuse CVXOPT conversions of :math:`P`,
+        :math:`G` and :math:`A` across calls, for instance when solving a
+        sequence of problems where only vectors change. Matrices are matched
+        by identity, so they should not be modified in place between calls.
 
     Returns
     -------
@@ -113,6 +502,16 @@ def cvxopt_solve_problem(
     a different cost than the one intended if a non-symmetric matrix is
     provided.
 
+    On small dense problems, say with less than a hundred variables, the
+    per-call overhead of CVXOPT tends to dominate the actual solve time.
+    Solvers listed in ``qpsolvers.dense_solvers``, for instance DAQP or
+    quadprog, are usually faster in this regime.
+
+    CVXOPT works in double precision. Single-precision or integer problem
+    data is accepted and cast once when converted to CVXOPT format, without
+    any change to solver settings. The solution is returned in double
+    precision.
+
     Keyword arguments are forwarded as options to CVXOPT. For instance, we can
     call ``cvxopt_solve_qp(P, q, G, h, u, abstol=1e-4, reltol=1e-4)``. CVXOPT
     options include the following:
@@ -142,33 +541,52 @@ def cvxopt_solve_problem(
     and dual residuals.
     """
     P, q, G, h, A, b, lb, ub = problem.unpack()
-    if lb is not None or ub is not None:
-        G, h = linear_from_box_inequalities(
-            G, h, lb, ub, use_sparse=problem.has_sparse
-        )
-
-    args = [__to_cvxopt(P), __to_cvxopt(q)]
-    constraints = {"G": None, "h": None, "A": None, "b": None}
-    if G is not None and h is not None:
-        constraints["G"] = __to_cvxopt(G)
-        constraints["h"] = __to_cvxopt(h)
+    P_cvxopt = __to_cvxopt_cached(P, cache, __cost_to_cvxopt)
+    q_cvxopt = __dense_to_cvxopt(q)
+    G_cvxopt, h_cvxopt, A_cvxopt, b_cvxopt = None, None, None, None
+    # Box rows are appended in CVXOPT only when G is sparse or absent, as
+    # stacking them onto a dense G would store all of its entries sparsely
+    if (
+        problem.has_sparse
+        and (lb is not None or ub is not None)
+        and (G is None or h is None or spa.issparse(G))
+    ):
+        if G is not None and h is not None:
+            G_cvxopt = __to_cvxopt_cached(G, cache)
+        G_cvxopt, h = __stack_box_inequalities(G_cvxopt, h, lb, ub)
+        h_cvxopt = __dense_to_cvxopt(h)
+    else:
+        if lb is not None or ub is not None:
+            G, h = linear_from_box_inequalities(
+                G, h, lb, ub, use_sparse=problem.has_sparse
+            )
+        if G is not None and h is not None:
+            G_cvxopt = __to_cvxopt_cached(G, cache)
+            h_cvxopt = __dense_to_cvxopt(h)
     if A is not None and b is not None:
-        constraints["A"] = __to_cvxopt(A)
-        constraints["b"] = __to_cvxopt(b)
+        A_cvxopt = __to_cvxopt_cached(A, cache)
+        b_cvxopt = __dense_to_cvxopt(b)
     initvals_dict: Optional[Dict[str, cvxopt.matrix]] = None
     if initvals is not None:
         if "mosek" in kwargs:
             warnings.warn("MOSEK: warm-start values are ignored")
-        initvals_dict = {"x": __to_cvxopt(initvals)}
+        initvals_dict = {"x": __dense_to_cvxopt(initvals)}
+    # Options are passed to this call only: the global dictionary
+    # cvxopt.solvers.options is left untouched, so that concurrent solves
+    # don't interfere with each other
     kwargs["show_progress"] = verbose
 
     try:
         res = qp(
-            *args,
+            P_cvxopt,
+            q_cvxopt,
+            G_cvxopt,
+            h_cvxopt,
+            A_cvxopt,
+            b_cvxopt,
             solver=solver,
             initvals=initvals_dict,
             options=kwargs,
-            **constraints,
         )
     except ValueError as exception:
         error = str(exception)
@@ -179,12 +597,13 @@ def cvxopt_solve_problem(
     solution = Solution(problem)
     solution.extras = res
     solution.found = "optimal" in res["status"]
-    solution.x = np.array(res["x"]).flatten()
+    # CVXOPT dense matrices expose their buffer: reshape views, don't copy
+    solution.x = np.asarray(res["x"]).reshape(-1)
     solution.y = (
-        np.array(res["y"]).flatten() if b is not None else np.empty((0,))
+        np.asarray(res["y"]).reshape(-1) if b is not None else np.empty((0,))
     )
     if h is not None and res["z"] is not None:
-        z_cvxopt = np.array(res["z"]).flatten()
+        z_cvxopt = np.asarray(res["z"]).reshape(-1)
         if z_cvxopt.size == h.size:
             z, z_box = split_dual_linear_box(z_cvxopt, lb, ub)
             solution.z = z
@@ -208,6 +627,7 @@ def cvxopt_solve_qp(
     solver: Optional[str] = None,
     initvals: Optional[np.ndarray] = None,
     verbose: bool = False,
+    cache: Optional[Dict[tuple, Any]] = None,
     **kwargs,
 ) -> Optional[np.ndarray]:
     r"""Solve a quadratic program using CVXOPT.
@@ -258,6 +678,9 @@ def cvxopt_solve_qp(
         Warm-start guess vector.
     verbose :
         Set to `True` to print out extra information.
+    cache :
+        Optional dictionary used to reuse CVXOPT conversions of matrices
+        across calls, see :func:`cvxopt_solve_problem`.
 
     Returns
     -------
@@ -274,6 +697,48 @@ def cvxopt_solve_qp(
     """
     problem = Problem(P, q, G, h, A, b, lb, ub)
     solution = cvxopt_solve_problem(
-        problem, solver, initvals, verbose, **kwargs
+        problem, solver, initvals, verbose, cache, **kwargs
     )
     return solution.x if solution.found else None
+
+
+def cvxopt_solve_qp_batch(
+    problems: Iterable[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+) -> List[Optional[np.ndarray]]:
+    """Solve independent quadratic programs in parallel using CVXOPT.
+
+    Parameters
+    ----------
+    problems :
+        Keyword arguments of :func:`cvxopt_solve_qp` for each problem, for
+        instance ``{"P": P, "q": q, "G": G, "h": h}``.
+    max_workers :
+        Maximum number of threads. Defaults to the choice of
+        :class:`concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    :
+        Primal solution of each QP, if found, otherwise ``None``, in the same
+        order as the input problems.
+
+    Raises
+    ------
+    ProblemError
+        If the CVXOPT rank assumption is not satisfied for a problem.
+
+    SolverError
+        If CVXOPT failed with an error on a problem.
+
+    Notes
+    -----
+    CVXOPT releases the GIL in its BLAS and LAPACK calls, but its solver
+    iterations run in Python. Speedups are therefore best on dense problems
+    where linear algebra dominates. Solver settings are passed to each call
+    separately, so that threads don't share CVXOPT global options.
+    """
+    with ThreadPoolExecutor(max_workers) as executor:
+        return list(
+            executor.map(lambda kwargs: cvxopt_solve_qp(**kwargs), problems)
+        )
@@ -22,7 +22,11 @@ from .problems import get_sd3310_problem
 try:
     import cvxopt
 
-    from qpsolvers.solvers.cvxopt_ import cvxopt_solve_problem, cvxopt_solve_qp
+    from qpsolvers.solvers.cvxopt_ import (
+        cvxopt_solve_problem,
+        cvxopt_solve_qp,
+        cvxopt_solve_qp_batch,
+    )
 
     class TestCVXOPT(unittest.TestCase):
         """Test fixture for the CVXOPT solver."""
@@ -68,6 +72,156 @@ try:
             self.assertLess(norm(x - known_solution), sol_tolerance)
             self.assertLess(max(G.dot(x) - h), 1e-10)
 
+        def test_sparse_formats(self):
+            """CSC and other sparse formats yield the same solution."""
+            P, q, G, h = self.get_sparse_problem()
+            x_csc = cvxopt_solve_qp(P, q, G, h)
+            x_csr = cvxopt_solve_qp(spa.csr_matrix(P), q, spa.coo_matrix(G), h)
+            x_lil = cvxopt_solve_qp(spa.lil_matrix(P), q, spa.dok_matrix(G), h)
+            self.assertIsNotNone(x_csc)
+            self.assertIsNotNone(x_csr)
+            self.assertIsNotNone(x_lil)
+            self.assertLess(norm(x_csc - x_csr), 1e-8)
+            self.assertLess(norm(x_csc - x_lil), 1e-8)
+
+        def test_sparse_box_inequalities(self):
+            """Sparse and dense problems with box bounds agree."""
+            P, q, G, h = self.get_sparse_problem()
+            n = q.shape[0]
+            lb = np.full(n, -1.0)
+            ub = np.full(n, 2.5)
+            ub[0] = +np.inf
+            for bounds in ((lb, None), (None, ub), (lb, ub)):
+                for G_, h_ in ((None, None), (G, h), (G.toarray(), h)):
+                    x_sparse = cvxopt_solve_qp(
+                        P, q, G_, h_, None, None, *bounds
+                    )
+                    x_dense = cvxopt_solve_qp(
+                        P.toarray(),
+                        q,
+                        G_.toarray() if spa.issparse(G_) else G_,
+                        h_,
+                        None,
+                        None,
+                        *bounds,
+                    )
+                    self.assertIsNotNone(x_sparse)
+                    self.assertIsNotNone(x_dense)
+                    self.assertLess(norm(x_sparse - x_dense), 1e-5)
+
+        def test_cache(self):
+            """Matrix conversions are reused and released with their source."""
+            P, q, G, h = self.get_sparse_problem()
+            cache = {}
+            x = cvxopt_solve_qp(P, q, G, h, cache=cache)
+            self.assertEqual(len(cache), 2)
+            x_cached = cvxopt_solve_qp(P, 2.0 * q, G, h, cache=cache)
+            self.assertEqual(len(cache), 2)
+            self.assertIsNotNone(x)
+            self.assertIsNotNone(x_cached)
+            del P, G
+            self.assertEqual(len(cache), 0)
+
+        def test_dense_dtypes_and_layouts(self):
+            """Integer and non-contiguous dense inputs are converted."""
+            problem = get_sd3310_problem()
+            x = cvxopt_solve_qp(
+                problem.P,
+                problem.q,
+                problem.G,
+                problem.h,
+                problem.A,
+                problem.b,
+            )
+            P_strided = np.zeros((2 * problem.P.shape[0], problem.P.shape[1]))
+            P_strided[::2] = problem.P
+            x_converted = cvxopt_solve_qp(
+                P_strided[::2],
+                np.asfortranarray(problem.q),
+                np.asfortranarray(problem.G),
+                problem.h,
+                problem.A.astype(int),
+                problem.b,
+            )
+            self.assertIsNotNone(x)
+            self.assertIsNotNone(x_converted)
+            self.assertLess(norm(x - x_converted), 1e-6)
+
+        def test_diagonal_cost(self):
+            """Dense diagonal cost matrices are solved as sparse ones."""
+            n = 150
+            w = np.linspace(-1.0, 1.0, n)
+            P = np.diag(np.linspace(1.0, 2.0, n))
+            q = -P.dot(w)
+            G = np.ones((1, n))
+            h = np.array([0.0])
+            x_dense = cvxopt_solve_qp(P, q, G, h, lb=-0.5 * ones(n))
+            x_sparse = cvxopt_solve_qp(
+                spa.csc_matrix(P), q, G, h, lb=-0.5 * ones(n)
+            )
+            self.assertIsNotNone(x_dense)
+            self.assertIsNotNone(x_sparse)
+            self.assertLess(norm(x_dense - x_sparse), 1e-6)
+
+        def test_batch(self):
+            """Batched solutions match sequential ones, in order."""
+            problem = get_sd3310_problem()
+            batch = [
+                {
+                    "P": problem.P,
+                    "q": scale * problem.q,
+                    "G": problem.G,
+                    "h": problem.h,
+                    "A": problem.A,
+                    "b": problem.b,
+                }
+                for scale in (0.5, 1.0, 2.0, 4.0)
+            ]
+            solutions = cvxopt_solve_qp_batch(batch, max_workers=2)
+            self.assertEqual(len(solutions), len(batch))
+            for kwargs, x in zip(batch, solutions):
+                self.assertIsNotNone(x)
+                self.assertLess(norm(x - cvxopt_solve_qp(**kwargs)), 1e-10)
+
+        def test_writeable_solution(self):
+            """Primal solution is a flat float64 array that can be edited."""
+            problem = get_sd3310_problem()
+            solution = cvxopt_solve_problem(problem)
+            x = solution.x
+            self.assertEqual(x.shape, (problem.q.shape[0],))
+            self.assertEqual(x.dtype, np.float64)
+            self.assertTrue(x.flags.writeable)
+            x_copy = x.copy()
+            x *= 2.0
+            self.assertLess(norm(solution.x - 2.0 * x_copy), 1e-12)
+
+        def test_single_precision(self):
+            """Single-precision problems are solved in double precision."""
+            P, q, G, h = self.get_sparse_problem()
+            x = cvxopt_solve_qp(P, q, G, h)
+            x_f32 = cvxopt_solve_qp(
+                P.astype(np.float32),
+                q.astype(np.float32),
+                G.astype(np.float32),
+                h.astype(np.float32),
+            )
+            self.assertIsNotNone(x_f32)
+            self.assertEqual(x_f32.dtype, np.float64)
+            self.assertLess(norm(x - x_f32), 1e-5)
+
+        def test_cache_cost_and_inequality(self):
+            """Cost and inequality conversions of one matrix don't collide."""
+            M = spa.csc_matrix(
+                np.array([[2.0, 1.0, 0.0], [1.0, 2.0, 1.0], [0.0, 1.0, 2.0]])
+            )
+            q = -ones(3)
+            h = 0.5 * ones(3)
+            x = cvxopt_solve_qp(M, q, M, h)
+            x_cached = cvxopt_solve_qp(M, q, M, h, cache={})
+            self.assertIsNotNone(x)
+            self.assertIsNotNone(x_cached)
+            self.assertLess(norm(x - x_cached), 1e-6)
+
         def test_extra_kwargs(self):
             """Call CVXOPT with various solver-specific settings."""
             problem = get_sd3310_problem()
@@ -86,6 +240,15 @@ try:
             )
             self.assertIsNotNone(x)
 
+        def test_global_options_untouched(self):
+            """Solver settings don't leak into CVXOPT global options."""
+            options_before = dict(cvxopt.solvers.options)
+            problem = get_sd3310_problem()
+            cvxopt_solve_problem(
+                problem, verbose=False, maxiters=10, abstol=1e-1
+            )
+            self.assertEqual(dict(cvxopt.solvers.options), options_before)
+
         def test_infinite_linear_bounds(self):
             """CVXOPT does not yield a domain error on infinite bounds."""
             problem, _ = get_qpsut01()